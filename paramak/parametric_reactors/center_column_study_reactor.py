@@ -1,8 +1,143 @@
 
 import warnings
+from functools import lru_cache
+from multiprocessing import Pool
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import numpy as np
 
 import paramak
 
+# components of CenterColumnStudyReactor, cached on the parameters they use
+
+
+@lru_cache(maxsize=32)
+def _build_plasma(major_radius, minor_radius, elongation, triangularity,
+                  rotation_angle):
+    return paramak.Plasma(
+        major_radius=major_radius,
+        minor_radius=minor_radius,
+        elongation=elongation,
+        triangularity=triangularity,
+        rotation_angle=rotation_angle,
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_inboard_tf_coils(height, inner_radius, outer_radius,
+                            rotation_angle):
+    return paramak.CenterColumnShieldCylinder(
+        height=height,
+        inner_radius=inner_radius,
+        outer_radius=outer_radius,
+        rotation_angle=rotation_angle,
+        stp_filename="inboard_tf_coils.stp",
+        stl_filename="inboard_tf_coils.stl",
+        name="inboard_tf_coils",
+        material_tag="inboard_tf_coils_mat",
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_center_column_shield(height, arc_height, inner_radius, mid_radius,
+                                outer_radius, rotation_angle):
+    return paramak.CenterColumnShieldFlatTopHyperbola(
+        height=height,
+        arc_height=arc_height,
+        inner_radius=inner_radius,
+        mid_radius=mid_radius,
+        outer_radius=outer_radius,
+        rotation_angle=rotation_angle)
+
+
+@lru_cache(maxsize=32)
+def _build_inboard_firstwall(central_column_shield, thickness,
+                             rotation_angle):
+    return paramak.InboardFirstwallFCCS(
+        central_column_shield=central_column_shield,
+        thickness=thickness,
+        rotation_angle=rotation_angle)
+
+
+@lru_cache(maxsize=32)
+def _build_blanket_cutter(height, outer_radius, rotation_angle):
+    return paramak.CenterColumnShieldCylinder(
+        height=height,
+        inner_radius=0,
+        outer_radius=outer_radius,
+        rotation_angle=rotation_angle
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_blanket_envelope(plasma, inner_plasma_gap_radial_thickness,
+                            plasma_gap_vertical_thickness,
+                            outer_plasma_gap_radial_thickness,
+                            rotation_angle):
+    return paramak.BlanketFP(
+        plasma=plasma,
+        thickness=100.,
+        offset_from_plasma=[
+            inner_plasma_gap_radial_thickness,
+            plasma_gap_vertical_thickness,
+            outer_plasma_gap_radial_thickness,
+            plasma_gap_vertical_thickness,
+            inner_plasma_gap_radial_thickness],
+        start_angle=-180,
+        stop_angle=180,
+        rotation_angle=rotation_angle,
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_blanket(plasma, inner_plasma_gap_radial_thickness,
+                   plasma_gap_vertical_thickness,
+                   outer_plasma_gap_radial_thickness, rotation_angle,
+                   blanket_cutter):
+    return paramak.BlanketFP(
+        plasma=plasma,
+        thickness=100.,
+        offset_from_plasma=[
+            inner_plasma_gap_radial_thickness,
+            plasma_gap_vertical_thickness,
+            outer_plasma_gap_radial_thickness,
+            plasma_gap_vertical_thickness,
+            inner_plasma_gap_radial_thickness],
+        start_angle=-180,
+        stop_angle=180,
+        rotation_angle=rotation_angle,
+        cut=[blanket_cutter]
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_divertor(height, inner_radius, outer_radius, rotation_angle,
+                    blanket_envelope):
+    return paramak.CenterColumnShieldCylinder(
+        height=height,
+        inner_radius=inner_radius,
+        outer_radius=outer_radius,
+        rotation_angle=rotation_angle,
+        stp_filename="divertor.stp",
+        stl_filename="divertor.stl",
+        name="divertor",
+        material_tag="divertor_mat",
+        intersect=blanket_envelope,
+    )
+
+
+_CACHED_BUILDERS = (
+    _build_plasma,
+    _build_inboard_tf_coils,
+    _build_center_column_shield,
+    _build_inboard_firstwall,
+    _build_blanket_cutter,
+    _build_blanket_envelope,
+    _build_blanket,
+    _build_divertor,
+)
+
 
 class CenterColumnStudyReactor(paramak.Reactor):
     """Creates geometry for a simple reactor that is optimised for carrying
@@ -13,6 +148,15 @@ class CenterColumnStudyReactor(paramak.Reactor):
     neutronics simulations to run quickly and the column design space to be
     explored efficiently.
 
+    Components are cached on the parameters they depend on and are shared
+    between reactors created with matching parameters, so sweeping one
+    thickness only rebuilds the components that depend on it. Modifying a
+    component in place (e.g. its material_tag or stp_filename) therefore
+    also modifies it in the other reactors sharing it. The cache holds the
+    CAD solids of up to 32 entries per component, and components used as
+    keys of another cache stay alive until it is emptied with
+    CenterColumnStudyReactor.clear_cache().
+
     Arguments:
         inner_bore_radial_thickness (float): the radial thickness of the
             inner bore (cm)
@@ -43,6 +187,40 @@ class CenterColumnStudyReactor(paramak.Reactor):
             Defaults to 360.0.
     """
 
+    _warned_360 = False
+
+    # The radial and vertical build are slotted as they are derived from the
+    # parameters. The parameters themselves must remain in the instance
+    # __dict__ as that is what the hash used to detect changes is built from.
+    __slots__ = (
+        "_inner_bore_start_radius",
+        "_inner_bore_end_radius",
+        "_inboard_tf_coils_start_radius",
+        "_inboard_tf_coils_end_radius",
+        "_center_column_shield_start_radius",
+        "_center_column_shield_end_radius_upper",
+        "_center_column_shield_end_radius_mid",
+        "_inboard_firstwall_start_radius",
+        "_inboard_firstwall_end_radius",
+        "_divertor_start_radius",
+        "_divertor_end_radius",
+        "_inner_plasma_gap_start_radius",
+        "_inner_plasma_gap_end_radius",
+        "_plasma_start_radius",
+        "_plasma_end_radius",
+        "_outer_plasma_gap_start_radius",
+        "_outer_plasma_gap_end_radius",
+        "_outboard_blanket_start_radius",
+        "_outboard_blanket_end_radius",
+        "_plasma_to_blanket_gap_start_height",
+        "_plasma_to_blanket_gap_end_height",
+        "_blanket_start_height",
+        "_blanket_end_height",
+        "_center_column_shield_end_height",
+        "_inboard_firstwall_end_height",
+        "_blanket_cutter_height",
+    )
+
     def __init__(
         self,
         inner_bore_radial_thickness,
@@ -84,21 +262,70 @@ class CenterColumnStudyReactor(paramak.Reactor):
         self.elongation = elongation
         self.triangularity = triangularity
 
-        # sets major radius and minor radius from equatorial_points to allow a
-        # radial build this helps avoid the plasma overlapping the center
-        # column and other components
-
-        inner_equatorial_point = (
-            inner_bore_radial_thickness
-            + inboard_tf_leg_radial_thickness
-            + center_column_shield_radial_thickness_mid
-            + inner_plasma_gap_radial_thickness
+    @property
+    def major_radius(self):
+        """The major radius of the plasma, derived from the radial build so
+        that the plasma does not overlap the center column"""
+        return (self._outer_equatorial_point +
+                self._inner_equatorial_point) / 2
+
+    @property
+    def minor_radius(self):
+        """The minor radius of the plasma, derived from the radial build"""
+        return self.major_radius - self._inner_equatorial_point
+
+    @property
+    def _inner_equatorial_point(self):
+        return (
+            self.inner_bore_radial_thickness
+            + self.inboard_tf_leg_radial_thickness
+            + self.center_column_shield_radial_thickness_mid
+            + self.inner_plasma_gap_radial_thickness
         )
-        outer_equatorial_point = \
-            inner_equatorial_point + plasma_radial_thickness
-        self.major_radius = \
-            (outer_equatorial_point + inner_equatorial_point) / 2
-        self.minor_radius = self.major_radius - inner_equatorial_point
+
+    @property
+    def _outer_equatorial_point(self):
+        return self._inner_equatorial_point + self.plasma_radial_thickness
+
+    @property
+    def plasma(self):
+        """The plasma component"""
+        return self._get_component("_plasma")
+
+    @property
+    def inboard_tf_coils(self):
+        """The inboard leg of the toroidal field coils"""
+        return self._get_component("_inboard_tf_coils")
+
+    @property
+    def center_column_shield(self):
+        """The center column shield component"""
+        return self._get_component("_center_column_shield")
+
+    @property
+    def inboard_firstwall(self):
+        """The inboard firstwall component"""
+        return self._get_component("_inboard_firstwall")
+
+    @property
+    def blanket(self):
+        """The outboard blanket component, with the center column and the
+        divertor cut out of it"""
+        return self._get_component("_blanket")
+
+    @property
+    def divertor(self):
+        """The divertor component"""
+        return self._get_component("_divertor")
+
+    def _get_component(self, attribute_name):
+        # accessing shapes_and_components (re)creates the parametric
+        # components when a parameter has changed. This only instantiates the
+        # paramak.Shape objects, the CAD solid of each component is built
+        # when its .solid is first accessed, so studies that only need some
+        # of the components do not pay for the others.
+        self.shapes_and_components
+        return getattr(self, attribute_name)
 
     def create_solids(self):
         """Creates a 3d solids for each component.
@@ -116,189 +343,283 @@ class CenterColumnStudyReactor(paramak.Reactor):
         shapes_and_components.append(self._make_inboard_tf_coils())
         shapes_and_components.append(self._make_center_column_shield())
         shapes_and_components.append(self._make_inboard_firstwall())
+        self._make_blanket_envelope()
         shapes_and_components.append(self._make_outboard_blanket())
         shapes_and_components.append(self._make_divertor())
 
         self.shapes_and_components = shapes_and_components
 
+    @classmethod
+    def clear_cache(cls):
+        """Empties the caches of components shared between reactors. Reactors
+        created afterwards build new components and the CAD solids held by
+        the cache can be freed."""
+
+        for builder in _CACHED_BUILDERS:
+            builder.cache_clear()
+
+    @classmethod
+    def sweep(cls, parameters, n_workers=None):
+        """Builds a reactor for each set of parameters, spreading the builds
+        over a pool of processes. CadQuery solids can not be pickled to be
+        returned from the worker processes, so each component is returned as
+        the contents of its stp file.
+
+        Args:
+            parameters (list of dict): the keyword arguments used to create
+                each CenterColumnStudyReactor.
+            n_workers (int, optional): the number of worker processes.
+                Defaults to None which uses the number of CPUs.
+
+        Returns:
+            list of dict: for each set of parameters, a dictionary with the
+            stp_filename of each component as keys and the contents of the
+            stp file (bytes) as values.
+        """
+
+        with Pool(n_workers) as pool:
+            return pool.map(cls._build_one, parameters)
+
+    @classmethod
+    def _build_one(cls, parameters):
+
+        reactor = cls(**parameters)
+        stp_files = {}
+        with TemporaryDirectory() as output_folder:
+            for component in reactor.shapes_and_components:
+                filename = component.export_stp(
+                    filename=Path(output_folder) / component.stp_filename)
+                stp_files[component.stp_filename] = \
+                    Path(filename).read_bytes()
+        return stp_files
+
+    @staticmethod
+    def validate_params(params: np.ndarray) -> np.ndarray:
+        """Checks many sets of parameters at once so that invalid reactors can
+        be filtered out of a parametric study before any geometry is built. A
+        set of parameters is valid when its triangularity is between -1 and 1,
+        which keeps the high point of the plasma within its radial extent.
+
+        Args:
+            params (np.ndarray): an array of shape (N, 13) with one set of
+                parameters per row. The columns are the arguments of
+                CenterColumnStudyReactor in order, from
+                inner_bore_radial_thickness to plasma_gap_vertical_thickness.
+
+        Raises:
+            ValueError: if params is not an array of shape (N, 13)
+
+        Returns:
+            np.ndarray: a boolean array of shape (N,) which is True for the
+            rows with valid parameters.
+        """
+
+        params = np.asarray(params, dtype=float)
+
+        if params.ndim != 2 or params.shape[1] != 13:
+            msg = "validate_params expects an array of shape (N, 13), " + \
+                "not {}".format(params.shape)
+            raise ValueError(msg)
+
+        triangularity = params[:, 11]
+
+        return (triangularity >= -1) & (triangularity <= 1)
+
     def _rotation_angle_check(self):
 
-        if self.rotation_angle == 360:
+        # the warning is only given once per process as parametric studies
+        # create many reactors with the same rotation_angle
+        if self.rotation_angle == 360 and \
+                not CenterColumnStudyReactor._warned_360:
             msg = "360 degree rotation may result " + \
                 "in a Standard_ConstructionError or AttributeError"
             warnings.warn(msg, UserWarning)
+            CenterColumnStudyReactor._warned_360 = True
 
     def _make_plasma(self):
 
-        plasma = paramak.Plasma(
-            major_radius=self.major_radius,
-            minor_radius=self.minor_radius,
-            elongation=self.elongation,
-            triangularity=self.triangularity,
-            rotation_angle=self.rotation_angle,
+        self._plasma = _build_plasma(
+            self.major_radius,
+            self.minor_radius,
+            self.elongation,
+            self.triangularity,
+            self.rotation_angle,
         )
-
-        self._plasma = plasma
-        return plasma
+        return self._plasma
 
     def _make_radial_build(self):
 
         # this is the radial build sequence, where one component stops and
-        # another starts
-
-        self._inner_bore_start_radius = 0
-        self._inner_bore_end_radius = self._inner_bore_start_radius + \
-            self.inner_bore_radial_thickness
+        # another starts. The build splits in two at the center column
+        # shield, one sequence for its upper (thicker) radius and one for its
+        # mid radius. The radii are computed as locals and assigned at the end
+        # to avoid repeated attribute lookups.
 
-        self._inboard_tf_coils_start_radius = self._inner_bore_end_radius
-        self._inboard_tf_coils_end_radius = \
-            self._inboard_tf_coils_start_radius + \
-            self.inboard_tf_leg_radial_thickness
+        inner_bore_end = self.inner_bore_radial_thickness
+        inboard_tf_coils_end = \
+            inner_bore_end + self.inboard_tf_leg_radial_thickness
 
-        self._center_column_shield_start_radius = \
-            self._inboard_tf_coils_end_radius
-        self._center_column_shield_end_radius_upper = \
-            self._center_column_shield_start_radius + \
+        center_column_shield_end_upper = inboard_tf_coils_end + \
             self.center_column_shield_radial_thickness_upper
-        self._center_column_shield_end_radius_mid = \
-            self._center_column_shield_start_radius + \
-            self.center_column_shield_radial_thickness_mid
-
-        self._inboard_firstwall_start_radius = \
-            self._center_column_shield_end_radius_upper
-        self._inboard_firstwall_end_radius = \
-            self._inboard_firstwall_start_radius + \
+        inboard_firstwall_end = center_column_shield_end_upper + \
             self.inboard_firstwall_radial_thickness
+        divertor_end = inboard_firstwall_end + self.divertor_radial_thickness
 
-        self._divertor_start_radius = self._inboard_firstwall_end_radius
-        self._divertor_end_radius = self._divertor_start_radius + \
-            self.divertor_radial_thickness
-
-        self._inner_plasma_gap_start_radius = \
-            self._center_column_shield_end_radius_mid + \
+        center_column_shield_end_mid = inboard_tf_coils_end + \
+            self.center_column_shield_radial_thickness_mid
+        inner_plasma_gap_start = center_column_shield_end_mid + \
             self.inboard_firstwall_radial_thickness
-
-        self._inner_plasma_gap_end_radius = \
-            self._inner_plasma_gap_start_radius + \
+        inner_plasma_gap_end = inner_plasma_gap_start + \
             self.inner_plasma_gap_radial_thickness
-
-        self._plasma_start_radius = self._inner_plasma_gap_end_radius
-        self._plasma_end_radius = \
-            self._plasma_start_radius + \
-            self.plasma_radial_thickness
-
-        self._outer_plasma_gap_start_radius = self._plasma_end_radius
-        self._outer_plasma_gap_end_radius = \
-            self._outer_plasma_gap_start_radius + \
-            self.outer_plasma_gap_radial_thickness
-
-        self._outboard_blanket_start_radius = self._outer_plasma_gap_end_radius
-        self._outboard_blanket_end_radius = \
-            self._outboard_blanket_start_radius + 100.
+        plasma_end = inner_plasma_gap_end + self.plasma_radial_thickness
+        outer_plasma_gap_end = \
+            plasma_end + self.outer_plasma_gap_radial_thickness
+        outboard_blanket_end = outer_plasma_gap_end + 100.
+
+        (
+            self._inner_bore_start_radius,
+            self._inner_bore_end_radius,
+            self._inboard_tf_coils_start_radius,
+            self._inboard_tf_coils_end_radius,
+            self._center_column_shield_start_radius,
+            self._center_column_shield_end_radius_upper,
+            self._center_column_shield_end_radius_mid,
+            self._inboard_firstwall_start_radius,
+            self._inboard_firstwall_end_radius,
+            self._divertor_start_radius,
+            self._divertor_end_radius,
+            self._inner_plasma_gap_start_radius,
+            self._inner_plasma_gap_end_radius,
+            self._plasma_start_radius,
+            self._plasma_end_radius,
+            self._outer_plasma_gap_start_radius,
+            self._outer_plasma_gap_end_radius,
+            self._outboard_blanket_start_radius,
+            self._outboard_blanket_end_radius,
+        ) = (
+            0,
+            inner_bore_end,
+            inner_bore_end,
+            inboard_tf_coils_end,
+            inboard_tf_coils_end,
+            center_column_shield_end_upper,
+            center_column_shield_end_mid,
+            center_column_shield_end_upper,
+            inboard_firstwall_end,
+            inboard_firstwall_end,
+            divertor_end,
+            inner_plasma_gap_start,
+            inner_plasma_gap_end,
+            inner_plasma_gap_end,
+            plasma_end,
+            plasma_end,
+            outer_plasma_gap_end,
+            outer_plasma_gap_end,
+            outboard_blanket_end,
+        )
 
     def _make_vertical_build(self):
 
         # this is the vertical build sequence, componets build on each other in
         # a similar manner to the radial build
 
-        self._plasma_to_blanket_gap_start_height = self._plasma.high_point[1]
-        self._plasma_to_blanket_gap_end_height = \
-            self._plasma_to_blanket_gap_start_height + \
-            self.plasma_gap_vertical_thickness
-
-        self._blanket_start_height = self._plasma_to_blanket_gap_end_height
-        self._blanket_end_height = self._blanket_start_height + 100.
-
-        self._center_column_shield_end_height = self._blanket_end_height
-        self._inboard_firstwall_end_height = self._blanket_end_height
+        plasma_to_blanket_gap_start = self._plasma.high_point[1]
+        blanket_start = \
+            plasma_to_blanket_gap_start + self.plasma_gap_vertical_thickness
+        blanket_end = blanket_start + 100.
+
+        (
+            self._plasma_to_blanket_gap_start_height,
+            self._plasma_to_blanket_gap_end_height,
+            self._blanket_start_height,
+            self._blanket_end_height,
+            self._center_column_shield_end_height,
+            self._inboard_firstwall_end_height,
+        ) = (
+            plasma_to_blanket_gap_start,
+            blanket_start,
+            blanket_start,
+            blanket_end,
+            blanket_end,
+            blanket_end,
+        )
 
     def _make_inboard_tf_coils(self):
 
-        self._inboard_tf_coils = paramak.CenterColumnShieldCylinder(
-            height=self._blanket_end_height * 2,
-            inner_radius=self._inboard_tf_coils_start_radius,
-            outer_radius=self._inboard_tf_coils_end_radius,
-            rotation_angle=self.rotation_angle,
-            stp_filename="inboard_tf_coils.stp",
-            stl_filename="inboard_tf_coils.stl",
-            name="inboard_tf_coils",
-            material_tag="inboard_tf_coils_mat",
+        self._inboard_tf_coils = _build_inboard_tf_coils(
+            self._blanket_end_height * 2,
+            self._inboard_tf_coils_start_radius,
+            self._inboard_tf_coils_end_radius,
+            self.rotation_angle,
         )
         return self._inboard_tf_coils
 
     def _make_center_column_shield(self):
 
-        self._center_column_shield = \
-            paramak.CenterColumnShieldFlatTopHyperbola(
-                height=self._center_column_shield_end_height * 2.,
-                arc_height=self.center_column_arc_vertical_thickness,
-                inner_radius=self._center_column_shield_start_radius,
-                mid_radius=self._center_column_shield_end_radius_mid,
-                outer_radius=self._center_column_shield_end_radius_upper,
-                rotation_angle=self.rotation_angle)
+        self._center_column_shield = _build_center_column_shield(
+            self._center_column_shield_end_height * 2.,
+            self.center_column_arc_vertical_thickness,
+            self._center_column_shield_start_radius,
+            self._center_column_shield_end_radius_mid,
+            self._center_column_shield_end_radius_upper,
+            self.rotation_angle)
         return self._center_column_shield
 
     def _make_inboard_firstwall(self):
 
-        self._inboard_firstwall = paramak.InboardFirstwallFCCS(
-            central_column_shield=self._center_column_shield,
-            thickness=self.inboard_firstwall_radial_thickness,
-            rotation_angle=self.rotation_angle)
+        self._inboard_firstwall = _build_inboard_firstwall(
+            self._center_column_shield,
+            self.inboard_firstwall_radial_thickness,
+            self.rotation_angle)
         return self._inboard_firstwall
 
+    def _make_blanket_envelope(self):
+
+        # the divertor starts where the center column ends so the envelope
+        # does not need the center column cut out of it
+        self._blanket_enveloppe = _build_blanket_envelope(
+            self._plasma,
+            self.inner_plasma_gap_radial_thickness,
+            self.plasma_gap_vertical_thickness,
+            self.outer_plasma_gap_radial_thickness,
+            self.rotation_angle,
+        )
+
+        # the blanket is offset along the normal of the plasma, so it can
+        # extend above _blanket_end_height when the radial gaps are larger
+        # than the vertical gap. The cutters are sized from the highest point
+        # of the blanket, with an extra 25% above and below to ensure overlap.
+        blanket_highest_point = max(
+            abs(point[1]) for point in self._blanket_enveloppe.points)
+        self._blanket_cutter_height = blanket_highest_point * 2.5
+
     def _make_outboard_blanket(self):
 
-        self._center_column_cutter = paramak.CenterColumnShieldCylinder(
-            # extra 1.5 to ensure overlap,
-            height=self._inboard_firstwall_end_height * 2.5,
-            inner_radius=0,
-            outer_radius=self._inboard_firstwall_end_radius,
-            rotation_angle=self.rotation_angle
+        # a single cylinder covering both the center column and the divertor
+        # removes them from the blanket in one boolean operation
+        self._blanket_cutter = _build_blanket_cutter(
+            self._blanket_cutter_height,
+            self._divertor_end_radius,
+            self.rotation_angle
         )
 
-        self._blanket = paramak.BlanketFP(
-            plasma=self._plasma,
-            thickness=100.,
-            offset_from_plasma=[
-                self.inner_plasma_gap_radial_thickness,
-                self.plasma_gap_vertical_thickness,
-                self.outer_plasma_gap_radial_thickness,
-                self.plasma_gap_vertical_thickness,
-                self.inner_plasma_gap_radial_thickness],
-            start_angle=-180,
-            stop_angle=180,
-            rotation_angle=self.rotation_angle,
-            cut=[self._center_column_cutter]
+        self._blanket = _build_blanket(
+            self._plasma,
+            self.inner_plasma_gap_radial_thickness,
+            self.plasma_gap_vertical_thickness,
+            self.outer_plasma_gap_radial_thickness,
+            self.rotation_angle,
+            self._blanket_cutter,
         )
         return self._blanket
 
     def _make_divertor(self):
-        self._blanket_enveloppe = paramak.BlanketFP(
-            plasma=self._plasma,
-            thickness=100.,
-            offset_from_plasma=[
-                self.inner_plasma_gap_radial_thickness,
-                self.plasma_gap_vertical_thickness,
-                self.outer_plasma_gap_radial_thickness,
-                self.plasma_gap_vertical_thickness,
-                self.inner_plasma_gap_radial_thickness],
-            start_angle=-180,
-            stop_angle=180,
-            rotation_angle=self.rotation_angle,
-            cut=[self._center_column_cutter]
-        )
 
-        self._divertor = paramak.CenterColumnShieldCylinder(
-            height=self._center_column_shield_end_height *
-            2.5,  # extra 0.5 to ensure overlap
-            inner_radius=self._divertor_start_radius,
-            outer_radius=self._divertor_end_radius,
-            rotation_angle=self.rotation_angle,
-            stp_filename="divertor.stp",
-            stl_filename="divertor.stl",
-            name="divertor",
-            material_tag="divertor_mat",
-            intersect=self._blanket_enveloppe,
+        self._divertor = _build_divertor(
+            self._blanket_cutter_height,
+            self._divertor_start_radius,
+            self._divertor_end_radius,
+            self.rotation_angle,
+            self._blanket_enveloppe,
         )
-        self._blanket.cut.append(self._divertor)
         return self._divertor
@@ -3,6 +3,7 @@ import os
 import unittest
 import warnings
 from pathlib import Path
+from unittest.mock import patch
 
 import paramak
 import pytest
@@ -66,19 +67,182 @@ class TestCenterColumnStudyReactor(unittest.TestCase):
 
     def test_rotation_angle_warning(self):
         """Checks that the correct warning message is printed when
-        rotation_angle = 360."""
+        rotation_angle = 360 and that it is only printed once."""
 
-        def warning_trigger():
+        def warning_trigger(reactor):
             try:
-                self.test_reactor.rotation_angle = 360
-                self.test_reactor.shapes_and_components
+                reactor.rotation_angle = 360
+                reactor.shapes_and_components
             except BaseException:
                 pass
 
-        with warnings.catch_warnings(record=True) as w:
+        with warnings.catch_warnings(record=True) as w, \
+                patch.object(
+                    paramak.CenterColumnStudyReactor, "_warned_360", False):
             warnings.simplefilter("always")
-            warning_trigger()
+            warning_trigger(self.test_reactor)
             assert len(w) == 1
             assert issubclass(w[-1].category, UserWarning)
             assert "360 degree rotation may result in a Standard_ConstructionError or AttributeError" in str(
                 w[-1].message)
+
+            self.setUp()
+            warning_trigger(self.test_reactor)
+            assert len(w) == 1
+
+    def test_component_properties(self):
+        """Checks that each component can be accessed individually and that
+        the plasma radii follow changes to the radial build."""
+
+        assert self.test_reactor.center_column_shield in \
+            self.test_reactor.shapes_and_components
+        assert self.test_reactor.blanket.volume > 0
+        assert self.test_reactor.major_radius == 300
+        assert self.test_reactor.minor_radius == 100
+
+        self.test_reactor.plasma_radial_thickness = 300
+        assert self.test_reactor.major_radius == 350
+        assert self.test_reactor.plasma.minor_radius == 150
+
+    def test_unchanged_components_are_reused(self):
+        """Checks that components whose parameters are unchanged are reused
+        between reactors while components that depend on a changed parameter
+        are rebuilt."""
+
+        tf_coils = self.test_reactor.inboard_tf_coils
+        shield = self.test_reactor.center_column_shield
+
+        self.test_reactor.center_column_shield_radial_thickness_upper = 90
+        assert self.test_reactor.inboard_tf_coils is tf_coils
+        assert self.test_reactor.center_column_shield is not shield
+
+    def test_components_shared_between_reactors(self):
+        """Checks that two separate reactors with matching parameters share
+        their components, and that they no longer do once the cache has been
+        cleared."""
+
+        self.test_reactor.shapes_and_components
+        shield = self.test_reactor.center_column_shield
+        self.setUp()
+        assert self.test_reactor.center_column_shield is shield
+
+        paramak.CenterColumnStudyReactor.clear_cache()
+        self.setUp()
+        assert self.test_reactor.center_column_shield is not shield
+
+    def test_blanket_and_divertor_do_not_overlap(self):
+        """Checks that the divertor is removed from the blanket."""
+
+        overlap = self.test_reactor.blanket.solid.intersect(
+            self.test_reactor.divertor.solid)
+        assert overlap.val().Volume() == pytest.approx(0, abs=1e-3)
+
+    def test_blanket_cutter_covers_blanket(self):
+        """Checks that no part of the blanket is left over the center column
+        and that the divertor is not truncated, which would be the case if
+        the cutters did not extend over the full height of the blanket. This
+        is also checked for a small vertical gap with large radial gaps,
+        where the blanket extends above _blanket_end_height."""
+
+        for parameters in [
+            {},
+            {
+                "plasma_gap_vertical_thickness": 5,
+                "outer_plasma_gap_radial_thickness": 150,
+            },
+            {
+                "elongation": 1.2,
+                "plasma_gap_vertical_thickness": 1,
+                "inner_plasma_gap_radial_thickness": 150,
+                "outer_plasma_gap_radial_thickness": 150,
+                "center_column_arc_vertical_thickness": 300,
+            },
+        ]:
+            with self.subTest(**parameters):
+                for name, value in parameters.items():
+                    setattr(self.test_reactor, name, value)
+
+                reactor = self.test_reactor
+                # (re)builds the components before reading the radial build
+                blanket = reactor.blanket.solid
+                divertor_volume = reactor.divertor.volume
+
+                center_column = paramak.CenterColumnShieldCylinder(
+                    height=reactor._blanket_end_height * 10,
+                    inner_radius=0,
+                    outer_radius=reactor._inboard_firstwall_end_radius,
+                    rotation_angle=reactor.rotation_angle)
+                overlap = blanket.intersect(center_column.solid)
+                assert overlap.val().Volume() == pytest.approx(0, abs=1e-3)
+
+                full_height_divertor = paramak.CenterColumnShieldCylinder(
+                    height=reactor._blanket_end_height * 10,
+                    inner_radius=reactor._divertor_start_radius,
+                    outer_radius=reactor._divertor_end_radius,
+                    rotation_angle=reactor.rotation_angle,
+                    intersect=reactor._blanket_enveloppe)
+                assert divertor_volume == pytest.approx(
+                    full_height_divertor.volume, rel=1e-6)
+
+    def test_sweep(self):
+        """Builds reactors for two sets of parameters using the sweep method
+        and checks that an stp file is returned for each component."""
+
+        parameters = dict(
+            inner_bore_radial_thickness=20,
+            inboard_tf_leg_radial_thickness=50,
+            center_column_shield_radial_thickness_mid=50,
+            center_column_shield_radial_thickness_upper=100,
+            inboard_firstwall_radial_thickness=20,
+            divertor_radial_thickness=100,
+            inner_plasma_gap_radial_thickness=80,
+            plasma_radial_thickness=200,
+            outer_plasma_gap_radial_thickness=90,
+            elongation=2.3,
+            triangularity=0.45,
+            plasma_gap_vertical_thickness=40,
+            center_column_arc_vertical_thickness=520,
+            rotation_angle=180
+        )
+        results = paramak.CenterColumnStudyReactor.sweep(
+            [parameters, {**parameters, "divertor_radial_thickness": 50}],
+            n_workers=2)
+
+        assert len(results) == 2
+        for stp_files in results:
+            assert len(stp_files) == 6
+            for contents in stp_files.values():
+                assert contents.startswith(b"ISO-10303-21")
+
+    def test_validate_params(self):
+        """Checks that validate_params flags the sets of parameters with a
+        triangularity outside of -1 to 1, including the boundary values, and
+        that a reactor at the boundary can be built."""
+
+        params = [
+            [20, 50, 50, 100, 20, 100, 80, 200, 90, 520, 2.3, 0.45, 40],
+            [20, 50, 50, 100, 20, 100, 80, 200, 90, 520, 2.3, 1., 40],
+            [20, 50, 50, 100, 20, 100, 77.7, 150.3, 90, 520, 2.3, -1., 40],
+            [20, 50, 50, 100, 20, 100, 80, 200, 90, 520, 2.3, 1.01, 40],
+            [20, 50, 50, 100, 20, 100, 80, 200, 90, 520, 2.3, -1.5, 40],
+        ]
+        mask = paramak.CenterColumnStudyReactor.validate_params(params)
+
+        assert mask.tolist() == [True, True, True, False, False]
+
+        self.test_reactor.inner_plasma_gap_radial_thickness = 77.7
+        self.test_reactor.plasma_radial_thickness = 150.3
+        self.test_reactor.triangularity = -1.
+        assert len(self.test_reactor.shapes_and_components) == 6
+
+    def test_validate_params_shape(self):
+        """Checks that a ValueError is raised when validate_params is not
+        given an array of shape (N, 13)."""
+
+        with pytest.raises(ValueError):
+            paramak.CenterColumnStudyReactor.validate_params(
+                [20, 50, 50, 100, 20, 100, 80, 200, 90, 520, 2.3, 0.45, 40])
+
+        with pytest.raises(ValueError):
+            paramak.CenterColumnStudyReactor.validate_params(
+                [[20, 50, 50, 100, 20, 100, 80, 200, 90, 520, 2.3, 0.45]])